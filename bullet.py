@@ -17,13 +17,21 @@ BULLET_SPEED = 25
 
 class Bullet(CommonSprite):
     size = Vec2(6, 6)
+    # if not shown, draw_sprite frees each bullet's surface so don't share one
+    shared_surface = SHOW_BULLETS
 
     def __init__(self, game: HasGame, pos: Vec2, target: Vec2,
                  *groups: pg.sprite.AbstractGroup):
-        self.set_game(game)
+        self._set_game_fast(game)
         super().__init__(None, pos, self.game.bullets, *groups, in_display=SHOW_BULLETS)
         self.target = target
 
+    def reset(self, game: HasGame, pos: Vec2, target: Vec2,
+              *groups: pg.sprite.AbstractGroup):
+        self._set_game_fast(game, 'reset')
+        super().reset(None, pos, self.game.bullets, *groups, in_display=SHOW_BULLETS)
+        self.target = target
+
     def draw_sprite(self):
         if SHOW_BULLETS:
             pg.draw.rect(self.surf, 'red4', self.surf.get_rect())
@@ -34,7 +42,7 @@ class Bullet(CommonSprite):
 
     def on_hit_enemy(self, enemy: CommonEnemy):
         enemy.on_hit_by_bullet(self)
-        self.kill()
+        self.release()
 
     def update(self, *args: Any, **kwargs: Any) -> None:
         enemy: CommonEnemy | None = pg.sprite.spritecollideany(self, self.game.enemies)
@@ -42,6 +50,6 @@ class Bullet(CommonSprite):
             self.on_hit_enemy(enemy)
             return
         if self.pos == self.target:
-            self.kill()
+            self.release()
+        # setting pos also updates the rect
         self.pos = self.pos.move_towards(self.target, BULLET_SPEED)
-        self.rect.center = self.pos
@@ -18,7 +18,7 @@ class CommonEnemy(CommonSprite):
     def __init__(self, game: HasGame, pos: Vec2,
                  *groups: pg.sprite.AbstractGroup,
                  is_in_enemies=True, **kwargs):
-        self.set_game(game)
+        self._set_game_fast(game)
         groups = (*groups, self.game.enemies) if is_in_enemies else groups
         super().__init__(None, pos, *groups, **kwargs)
 
@@ -31,7 +31,9 @@ class CommonEnemy(CommonSprite):
 
     def update(self, *args: Any, **kwargs: Any) -> None:
         """This update function handles killing player on contact"""
-        if pg.sprite.collide_rect(self, self.player):
+        # self.game.player instead of the self.player property as this is
+        # called for every enemy every tick
+        if pg.sprite.collide_rect(self, self.game.player):
             self.on_collide_player()
 
 
@@ -73,7 +75,7 @@ class EnemyWithHealth(CommonEnemy):
     def handle_movement(self):
         if self.immobile:
             return
-        self.pos = self.pos.move_towards(self.player.pos, self.speed)
+        self.pos = self.pos.move_towards(self.game.player.pos, self.speed)
 
     def update(self, *args: Any, **kwargs: Any) -> None:
         super().update(*args, **kwargs)
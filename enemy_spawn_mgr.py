@@ -154,7 +154,7 @@ class EnemySpawnMgr(UsesGame):
         self.strength += 0.0001 / 60
         self.spawn_all()
 
-    def on_kill_enemy(self, enemy: EnemyWithHealth):
+    def on_kill_enemy(self, enemy: EnemyWithHealth, _bullet=None):
         if not self.enabled:
             return
         self.strength += 0.0006 + enemy.max_hp * 0.0004
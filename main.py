@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging as lg
 import sys
 import time
-from typing import Any, overload, Union, TextIO
+from typing import Any, overload, Union, TextIO, Callable
 
 import pygame as pg
 from pygame import Vector2 as Vec2
@@ -12,19 +12,28 @@ from collectable import TurretItem
 from enemy import EnemyWithHealth
 from enemy_spawn_mgr import EnemySpawnMgr
 from perf import DEBUG_MEMORY, DEBUG_CPU, MemProf, CpuProfileContextManager
-from pg_util import render_text
+from pg_util import render_text, build_grid
 from player import Player
 from sprite_bases import RectUpdatingSprite
 from text_sprite import TextSprite
-from trigger_once import trigger_once
-from turret import TurretRangeIndicator
+from turret import TurretRangeIndicator, ENEMY_GRID_CELL
 from uses_game import UsesGame
 from util import option
 
 USE_FLIP = True
 ALLOW_CHEATS = True
+# let the driver wait for vblank instead of relying only on clock.tick
+USE_VSYNC = True
 
 FPS = 60
+WINDOW_FLAGS = pg.RESIZABLE | pg.DOUBLEBUF | pg.SCALED
+HANDLED_EVENTS = [pg.QUIT, pg.KEYDOWN, pg.VIDEORESIZE]
+# events that are never used so don't need to be put into the queue at all
+BLOCKED_EVENTS = [
+    pg.MOUSEMOTION, pg.TEXTINPUT, pg.TEXTEDITING, pg.ACTIVEEVENT,
+    pg.WINDOWENTER, pg.WINDOWLEAVE, pg.WINDOWSHOWN, pg.WINDOWHIDDEN,
+    pg.AUDIODEVICEADDED, pg.AUDIODEVICEREMOVED
+]
 
 
 class PGExit(BaseException):
@@ -71,6 +80,7 @@ class Game:
         self._init_fonts()
         self._init_groups()
         self._init_window()
+        self._init_events()
         self._init_components()
         self._init_objects()
 
@@ -103,18 +113,33 @@ class Game:
         self.log.info('Initializing groups')
         self.root_group = pg.sprite.Group()
         # todo should use LayeredUpdates / LayeredDirty
-        self.display_group = pg.sprite.RenderUpdates()
+        # dirty rects are only needed if using pg.display.update
+        # (Group.draw is a single blits call and doesn't track them)
+        self.display_group = (pg.sprite.Group() if USE_FLIP
+                              else pg.sprite.RenderUpdates())
         self.enemies = pg.sprite.Group()
+        self.enemy_grid: dict[tuple[int, int], list[EnemyWithHealth]] = {}
         self.turret_range_overlays = pg.sprite.Group()
         self.bullets = pg.sprite.Group()
         self.turrets = pg.sprite.Group()
 
     def _init_window(self):
         self.log.info('Initializing window')
-        self.screen = pg.display.set_mode((1600, 900), pg.RESIZABLE, display=0)
+        # with SCALED, self.screen keeps its logical size when the window is
+        # resized (on_resize still gets the real window size via event.size)
+        self.screen = self._set_mode((1600, 900), WINDOW_FLAGS)
+        pg.event.set_blocked(BLOCKED_EVENTS)
         self.dirty_this_frame: list[pg.Rect] = []
         self._clear_window()
 
+    def _set_mode(self, size: tuple[int, int], flags: int) -> pg.Surface:
+        if USE_VSYNC:
+            try:
+                return pg.display.set_mode(size, flags, display=0, vsync=1)
+            except pg.error as e:
+                self.log.warning(f'Could not enable vsync ({e}), falling back to no vsync')
+        return pg.display.set_mode(size, flags, display=0)
+
     def _clear_window(self):
         self.log.info('Clearing window')
         self.screen.fill((255, 255, 255))
@@ -123,22 +148,39 @@ class Game:
     def _init_objects(self):
         self.log.info('Initializing objects')
         self.player = Player(self, Vec2(700, 400))
+        self.subscribe('kill_enemy', self.player.on_kill_enemy)
         TurretItem(self, Vec2(400, 600))
         self.initial_enemy = EnemyWithHealth(self, Vec2(50, 655), 1, immobile=True)
         self.turrets_text = TurretsText(self)
         self.fps_text = FpsText(self)
         self.enemy_info_text = EnemyInfoText(self)
 
+    def _init_events(self):
+        self.log.info('Initializing events')
+        self._bus: dict[str, list[Callable]] = {}
+        self._key_handlers: dict[int, Callable[[], Any]] = {}
+        if DEBUG_CPU:
+            self._key_handlers[pg.K_p] = self.on_cpu_prof_key
+        if DEBUG_MEMORY:
+            self._key_handlers[pg.K_m] = self.on_mem_prof_key
+        if ALLOW_CHEATS:
+            self._key_handlers[pg.K_t] = self.on_turrets_cheat_key
+
     def _init_components(self):
         self.log.info('Initializing components')
-        self.mem_prof = MemProf()
+        self.mem_prof = MemProf(DEBUG_MEMORY)
         self.enemy_spawner = EnemySpawnMgr(self)
+        self.subscribe('tick', self.enemy_spawner.on_tick)
+        self.subscribe('kill_enemy', self.enemy_spawner.on_kill_enemy)
         self.tutorial = Tutorial(self)
 
     def mainloop_inner(self):
+        # bind these once as this loop runs every frame
+        do_one_frame = self.do_one_frame
+        wait_for_next_frame = self.wait_for_next_frame
         while True:
-            self.do_one_frame()
-            self.wait_for_next_frame()
+            do_one_frame()
+            wait_for_next_frame()
 
     def mainloop(self):
         try:
@@ -171,13 +213,15 @@ class Game:
         self.frame_start = time.perf_counter()
 
     def after_frame(self):
-        self.frame_end = time.perf_counter()
-        self.frame_time = self.frame_end - self.frame_start
+        self.frame_end = frame_end = time.perf_counter()
+        self.frame_time = frame_end - self.frame_start
         if self.curr_tick % 10 == 1:
             self.log.debug(f'Update took: {self.frame_time * 1000:.2f}ms')
             self.log.debug(f'FPS: {self.clock.get_fps():.2f}')
 
     def wait_for_next_frame(self):
+        # when vsync is on, flip() already blocks until vblank so this
+        # is only a safety cap (e.g. for high refresh rate monitors)
         self.clock.tick(FPS)
         self.curr_tick += 1
 
@@ -199,12 +243,13 @@ class Game:
         self.draw_objects()
 
     def draw_objects(self):
+        screen = self.screen
         if USE_FLIP:
-            self.display_group.draw(self.screen)
+            self.display_group.draw(screen)
             TurretRangeIndicator.draw_all(self)
             pg.display.flip()
         else:
-            dirty = self.display_group.draw(self.screen)
+            dirty = self.display_group.draw(screen)
             TurretRangeIndicator.draw_all(self)
             dirty += self.dirty_this_frame
             pg.display.update(dirty)
@@ -212,36 +257,69 @@ class Game:
     def do_tick(self):
         if self.player.is_dead:
             return
+        if self.turrets:
+            # turrets only search the cells around them instead of every enemy
+            self.enemy_grid = build_grid(self.enemies, ENEMY_GRID_CELL)
         self.root_group.update()
         self.on_post_tick()
 
     def on_post_tick(self):
-        self.enemy_spawner.on_tick()
+        self.emit('tick')
 
     def on_player_die(self):
         GameOver(self)
         self.log.info("Game over")
 
-    # todo observer pattern for on_* methods
     def on_kill_enemy(self, enemy, bullet):
-        self.enemy_spawner.on_kill_enemy(enemy)
-        self.player.on_kill_enemy(enemy, bullet)
+        self.emit('kill_enemy', enemy, bullet)
+
+    def subscribe(self, event: str, fn: Callable):
+        self._bus.setdefault(event, []).append(fn)
+
+    def unsubscribe(self, event: str, fn: Callable):
+        # replace the list instead of mutating it so that unsubscribing
+        # from inside a handler doesn't break the loop in emit()
+        self._bus[event] = [f for f in self._bus[event] if f != fn]
+
+    def emit(self, event: str, *args):
+        for fn in self._bus.get(event, ()):
+            fn(*args)
 
     def handle_events(self):
-        for event in pg.event.get():
-            if event.type == pg.QUIT:
-                if DEBUG_MEMORY:
+        for event in pg.event.get(HANDLED_EVENTS):
+            if event.type == pg.KEYDOWN:
+                handler = self._key_handlers.get(event.key)
+                if handler is not None:
+                    handler()
+            elif event.type == pg.VIDEORESIZE:
+                self.on_resize(event)
+            elif event.type == pg.QUIT:
+                if DEBUG_MEMORY and self.mem_prof.snapshot is None:
                     # don't print it here, want to do
-                    # most processing after window closed
+                    # most processing after window closed.
+                    # Keep the one from pressing M if there is one
                     self.take_mem_snapshot()
                 raise PGExit
-            if event.type == pg.KEYDOWN and event.key == pg.K_p and DEBUG_CPU:
-                self.want_cpu_prof = True
-            if event.type == pg.KEYDOWN and event.key == pg.K_t and ALLOW_CHEATS:
-                self.player.turrets += 20
-                self.turrets_text.update()
-            if event.type == pg.VIDEORESIZE:
-                self.on_resize(event)
+        # drop the events we don't handle (without making Event objects)
+        # so they don't fill up the queue. Don't pump again as that could
+        # drop handled events that arrived since the get()
+        pg.event.clear(pump=False)
+
+    def on_cpu_prof_key(self):
+        self.want_cpu_prof = True
+
+    def on_turrets_cheat_key(self):
+        self.player.turrets += 20
+        self.turrets_text.update()
+
+    def on_mem_prof_key(self):
+        # first press starts tracing, the next one takes the snapshot
+        # that is printed after the window is closed
+        if not self.mem_prof.is_started:
+            self.log.info("Starting memory tracing")
+            self.mem_prof.start()
+        else:
+            self.take_mem_snapshot()
 
     def take_mem_snapshot(self):
         self.log.info("Taking memory snapshot")
@@ -353,9 +431,11 @@ class FpsText(TextSprite):
 class Tutorial(UsesGame):
     def __init__(self, game: Game | UsesGame):
         super().__init__(game)
+        self.game.subscribe('place_turret', self.place_turret)
 
-    @trigger_once
-    def place_turret(self):
+    def place_turret(self, _turret=None):
+        # only needs to happen once so stop listening
+        self.game.unsubscribe('place_turret', self.place_turret)
         self.game.enemy_spawner.enable(delay=40)
         self.game.initial_enemy.immobile = False
         self.log.info("Tutorial finished, entering main game.")
@@ -7,49 +7,68 @@ from pathlib import Path
 from util import fmt_size
 
 
+IMPORT_FILTERS = (
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
 def display_top(s: tracemalloc.Snapshot, key_type='lineno', limit=5,
                 filter_imports=False, full_path=True, disp_dir_depth=2):
     if filter_imports:
-        s = s.filter_traces((
-            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
-            tracemalloc.Filter(False, "<unknown>"),
-        ))
+        s = s.filter_traces(IMPORT_FILTERS)
     top_stats = s.statistics(key_type)
 
     print(f"Top {limit} lines")
     for index, stat in enumerate(top_stats[:limit]):
         frame = stat.traceback[0]
         # replace "/path/to/module/file.py" with "module/file.py"
-        short_name = Path(*Path(frame.filename).parts[-disp_dir_depth:])
-        print(f"#{index + 1}: {short_name}:{frame.lineno}: {fmt_size(stat.size)}"
-              f" (count={stat.count}, avg={fmt_size(stat.size / stat.count)})")
+        fn_parts = Path(frame.filename).parts
+        short_name = Path(*fn_parts[-disp_dir_depth:])
+        size_str = fmt_size(stat.size)
+        avg_str = fmt_size(stat.size / stat.count)
+        print(f"#{index + 1}: {short_name}:{frame.lineno}: {size_str}"
+              f" (count={stat.count}, avg={avg_str})")
         if full_path:
             print(f"    {stat}")
         line = linecache.getline(frame.filename, frame.lineno).strip()
         if line:
             print(f'        {line}')
 
-    other = top_stats[limit:]
-    if other:
-        size = sum(stat.size for stat in other)
-        print(f"{len(other)} other: {fmt_size(size)}")
+    n_other = len(top_stats) - limit
+    if n_other > 0:
+        other_size = sum(stat.size for stat in top_stats[limit:])
+        print(f"{n_other} other: {fmt_size(other_size)}")
     total = sum(stat.size for stat in top_stats)
     print(f"Total allocated size: {fmt_size(total)}")
 
 
 class MemProf:
-    def __init__(self, debug_memory=True, start=True):
+    def __init__(self, debug_memory=True, start=False, nframes=1):
+        """Tracing is expensive so it isn't started by default.
+
+        :param nframes: Number of frames to store for each traceback.
+            Only the most recent one is used by `display_top`"""
         self.debug_memory = debug_memory
+        self.nframes = nframes
         self.snapshot = None
         if start:
             self.start()
 
+    @property
+    def is_started(self):
+        return tracemalloc.is_tracing()
+
     def start(self):
-        if self.debug_memory:
-            tracemalloc.start()
+        # don't restart it if it is already running (e.g. from -X tracemalloc)
+        if self.debug_memory and not self.is_started:
+            tracemalloc.start(self.nframes)
 
     def take_snapshot(self):
-        self.snapshot = tracemalloc.take_snapshot() if self.debug_memory else None
+        if self.debug_memory and self.is_started:
+            self.snapshot = tracemalloc.take_snapshot()
+        else:
+            self.snapshot = None
         return self.snapshot
 
     def display_top(self, *args, **kwargs):
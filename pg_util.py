@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from math import inf
-from typing import Sequence
+from typing import Sequence, Iterable
 
 import pygame as pg
 from pygame import Vector2 as Vec2
@@ -75,3 +76,35 @@ else:
                 min_dist = dist
                 sprite = s
         return sprite
+
+
+def build_grid(sprites: Iterable[pg.sprite.Sprite], cell: float
+               ) -> dict[tuple[int, int], list[pg.sprite.Sprite]]:
+    """Bins the sprites by their ``pos`` into square cells of side ``cell``"""
+    grid = defaultdict(list)
+    for s in sprites:
+        x, y = s.pos
+        grid[int(x // cell), int(y // cell)].append(s)
+    return grid
+
+
+def nearest_in_grid(pos: Vec2, grid: dict[tuple[int, int], list[pg.sprite.Sprite]],
+                    cell: float, max_dist: float):
+    """Returns the nearest (alive) sprite in ``grid`` that is within
+    ``max_dist`` of ``pos`` or None. ``max_dist`` must not be more than
+    ``cell`` as only the 3x3 cells around ``pos`` are searched."""
+    best_dist = max_dist * max_dist
+    sprite = None
+    cx = int(pos.x // cell)
+    cy = int(pos.y // cell)
+    get = grid.get
+    for gx in (cx - 1, cx, cx + 1):
+        for gy in (cy - 1, cy, cy + 1):
+            for s in get((gx, gy), ()):
+                dist = pos.distance_squared_to(s.pos)
+                # the grid is built at the start of the tick so may contain
+                # sprites that were killed since then
+                if dist <= best_dist and s.alive():
+                    best_dist = dist
+                    sprite = s
+    return sprite
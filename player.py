@@ -18,6 +18,24 @@ SPEED = 3.8
 P_RADIUS = 20
 
 
+def _make_movement_table() -> tuple[tuple[float, float] | None, ...]:
+    """Index is a bitmask of (right, left, down, up) from LSB to MSB,
+    value is the movement for that combination of keys (or None if no movement)"""
+    table = []
+    for mask in range(16):
+        dx = bool(mask & 1) - bool(mask & 2)
+        dy = bool(mask & 4) - bool(mask & 8)
+        if dx or dy:
+            m = Vec2(dx, dy).normalize() * SPEED
+            table.append((m.x, m.y))
+        else:
+            table.append(None)
+    return tuple(table)
+
+
+_MOVEMENT_TABLE = _make_movement_table()
+
+
 class Player(CommonSprite):
     size = Vec2(P_RADIUS * 2, P_RADIUS * 2)
 
@@ -44,17 +62,12 @@ class Player(CommonSprite):
 
     def handle_movement(self):
         keys = pg.key.get_pressed()
-        m = Vec2()
-        if keys[pg.K_DOWN] or keys[pg.K_s]:
-            m += Vec2(0, 1)
-        if keys[pg.K_UP] or keys[pg.K_w]:
-            m += Vec2(0, -1)
-        if keys[pg.K_LEFT] or keys[pg.K_a]:
-            m += Vec2(-1, 0)
-        if keys[pg.K_RIGHT] or keys[pg.K_d]:
-            m += Vec2(1, 0)
-        if m.length_squared() != 0:
-            m = m.normalize() * SPEED
+        mask = ((keys[pg.K_RIGHT] | keys[pg.K_d])
+                | (keys[pg.K_LEFT] | keys[pg.K_a]) << 1
+                | (keys[pg.K_DOWN] | keys[pg.K_s]) << 2
+                | (keys[pg.K_UP] | keys[pg.K_w]) << 3)
+        m = _MOVEMENT_TABLE[mask]
+        if m is not None:
             self.pos += m
 
     def update(self, *args: Any, **kwargs: Any) -> None:
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from operator import attrgetter
+from typing import TYPE_CHECKING, ClassVar
 
 import pygame as pg
 
 from pg_util import rect_from_size
 from uses_game import UsesGame
-from util import option
 
 if TYPE_CHECKING:
     from main import HasGame
@@ -28,24 +28,29 @@ class GroupMemberSprite(GamePgSprite):
 
     def __init__(self, game: HasGame | None, *groups: pg.sprite.AbstractGroup,
                  in_root: bool = None, in_display: bool = None):
-        self.set_game(game, method_name='__init__')
+        self._set_game_fast(game)
         self._set_group_flags(in_root, in_display)
         super().__init__(None, *self._get_extra_groups(), *groups)
 
     def _set_group_flags(self, in_root: bool | None, in_display: bool | None):
-        self.in_root = option(in_root, self.in_root)
-        self.in_display = option(in_display, self.in_display)
+        # not using option() here as this is called for every sprite
+        if in_root is not None:
+            self.in_root = in_root
+        if in_display is not None:
+            self.in_display = in_display
         if self.in_display is None:
             # if not in root, probably should not be in display by default
             self.in_display = self.in_root
 
     def _get_extra_groups(self):
-        extra = []
+        # this is called for every sprite created so avoid building a list
         if self.in_root:
-            extra.append(self.root_group)
+            if self.in_display:
+                return self.root_group, self.display_group
+            return self.root_group,
         if self.in_display:
-            extra.append(self.display_group)
-        return tuple(extra)
+            return self.display_group,
+        return ()
 
 
 class DrawableSprite(GroupMemberSprite):
@@ -64,6 +69,9 @@ class DrawableSprite(GroupMemberSprite):
             self.rect = rect
 
     def set_surf(self, surf: pg.Surface):
+        # image is a separate attribute (not a property aliasing surf)
+        # because Group.draw reads it for every sprite every frame
+        # while this is only called when the surface changes
         self.surf = self.image = surf
 
 
@@ -75,7 +83,8 @@ class SizedSprite(DrawableSprite):
                  in_root: bool = None, in_display: bool = None):
         super().__init__(game, *groups, surf=surf, rect=rect,
                          in_root=in_root, in_display=in_display)
-        self.size = option(size, self.size)
+        if size is not None:
+            self.size = size
         if self.size is None:
             raise self._err_missing_size("__init__")
 
@@ -103,7 +112,8 @@ class PositionedSprite(SizedSprite):
                  in_root: bool = None, in_display: bool = None):
         super().__init__(game, *groups, surf=surf, rect=rect, size=size,
                          in_root=in_root, in_display=in_display)
-        self.pos = option(pos, self.pos)
+        if pos is not None:
+            self.pos = pos
         if self.pos is None:
             raise TypeError(f"pos must be passed to __init__"
                             " or set as a class attribute")
@@ -140,16 +150,17 @@ class RectUpdatingSprite(SurfaceMakingSprite):
         return self.surf.get_rect()
 
     def update_rect(self):
-        self.rect.center = self.pos
+        # this is faster than setting rect.x and rect.y separately
+        # (~50ns vs ~230ns) as pygame reads the Vector2 directly in C
+        self.rect.center = self._pos
 
-    @property
-    def pos(self) -> Vec2:
-        return self._pos
-
-    @pos.setter
-    def pos(self, value: Vec2):
+    def _pos_setter(self, value: Vec2):
         self.set_pos(value)
 
+    # pos is read very often so the getter is implemented in C
+    # (attrgetter) to avoid a python-level call
+    pos = property(attrgetter('_pos'), _pos_setter, doc="The center of this sprite")
+
     def set_pos(self, value: Vec2):
         # IMPORTANT: need to use `_pos` to not cause
         # `pos.setter -> set_pos -> ...` recursion
@@ -163,6 +174,26 @@ class RectUpdatingSprite(SurfaceMakingSprite):
 class CommonSprite(RectUpdatingSprite):
     """This is a base class for most sprites
     and needs to be subclassed to have any real use"""
+    pool_max: ClassVar[int] = 256
+    """Maximum number of released sprites to keep for re-use (per class)"""
+    _pool: ClassVar[list[CommonSprite]] = []
+    shared_surface: ClassVar[bool] = True
+    """If True, all instances of a class with the same size use the same surface,
+    which is only drawn (by `draw_sprite`) for the first one. Set this to False
+    if `draw_sprite` depends on anything other than the class and size or if
+    the surface is modified after it has been drawn."""
+    _surface_cache: ClassVar[dict[tuple[type, int, int], pg.Surface]] = {}
+    _has_draw_sprite: ClassVar[bool] = False
+    # whether surf/rect were made for this sprite only (so reset can re-use them)
+    _made_surf: bool = False
+    _made_rect: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # each class needs its own pool (can't re-use a Bullet as a Turret)
+        cls._pool = []
+        # no need to call it if it's the default one (that does nothing)
+        cls._has_draw_sprite = cls.draw_sprite is not CommonSprite.draw_sprite
 
     def __init__(self, game: HasGame | None, pos: Vec2, *groups: pg.sprite.AbstractGroup,
                  size=None, in_root: bool = None, in_display: bool = None,
@@ -179,11 +210,117 @@ class CommonSprite(RectUpdatingSprite):
         :param in_display: If False, doesn't add it to display_group
         :param surf: The surface to use, overrides `make_surface`
         """
-        self.set_game(game, method_name='__init__')
-        super().__init__(None, *groups, size=size, pos=pos,
-                         in_root=in_root, in_display=in_display,
-                         surf=surf, rect=rect)
-        self.draw_sprite()
+        # This does the same as the __init__s of the base classes
+        # (GamePgSprite -> ... -> RectUpdatingSprite) but inlined as
+        # sprites are created very often, so keep these in sync!
+        self._set_game_fast(game)
+        # GroupMemberSprite
+        self._set_group_flags(in_root, in_display)
+        pg.sprite.Sprite.__init__(self, *self._get_extra_groups(), *groups)
+        # SizedSprite
+        if size is not None:
+            self.size = size
+        elif self.size is None:
+            raise self._err_missing_size("__init__")
+        # PositionedSprite (rect is updated below so don't use the setter)
+        if pos is None:
+            pos = self._pos
+            if pos is None:
+                raise TypeError("pos must be passed to __init__"
+                                " or set as a class attribute")
+        self._pos = pos
+        # DrawableSprite, SurfaceMakingSprite and RectUpdatingSprite
+        if self._init_surf_and_rect(surf, rect) and self._has_draw_sprite:
+            self.draw_sprite()
+
+    def _init_surf_and_rect(self, surf: pg.Surface | None,
+                            rect: pg.Rect | None) -> bool:
+        """Set the surface and rect for `__init__` and `reset`. When called by
+        `reset`, the previous surface and rect are re-used if they were made
+        for this sprite (not passed in) and are still the right size.
+        Returns True if the surface needs to be drawn"""
+        need_draw = True
+        if surf is not None:
+            self.set_surf(surf)
+            self._made_surf = False
+        elif self.shared_surface:
+            need_draw = self._init_shared_surface()
+            self._made_surf = False
+        elif self._made_surf and self.surf.get_size() == (
+                int(self.size[0]), int(self.size[1])):
+            self.surf.fill((0, 0, 0, 0))
+        else:
+            self.surf = self.image = self.make_surface()
+            self._made_surf = True
+        if rect is not None:
+            self.rect = rect
+            self._made_rect = False
+        elif not self._made_rect or self.rect.size != self.surf.get_size():
+            self.rect = self.create_rect()
+            self._made_rect = True
+        self.update_rect()
+        return need_draw
+
+    def _surface_key(self):
+        return type(self), int(self.size[0]), int(self.size[1])
+
+    def _init_shared_surface(self) -> bool:
+        """Set the surface to the shared one, creating it if needed.
+        Returns True if it was created (so still needs to be drawn)"""
+        key = self._surface_key()
+        surf = self._surface_cache.get(key)
+        created = surf is None
+        if created:
+            surf = self._surface_cache[key] = self.make_surface()
+        self.surf = self.image = surf
+        return created
+
+    @classmethod
+    def acquire(cls, *args, **kwargs):
+        """Get a released sprite from the pool (re-initialised using `reset`)
+        or create a new one if there aren't any. Takes the same arguments as
+        `__init__` (and `reset`). Use this (and `release`) for short-lived
+        sprites to avoid allocating new sprites and surfaces."""
+        if cls._pool:
+            inst = cls._pool.pop()
+            inst.reset(*args, **kwargs)
+            return inst
+        return cls(*args, **kwargs)
+
+    def release(self):
+        """Kill this sprite and put it in the pool to be re-used by `acquire`.
+        Nothing else should keep using this sprite after this is called"""
+        # if already dead, it has already been released (or was never in
+        # any groups) so don't add it twice as then it could be acquired twice
+        if not self.alive():
+            return
+        self.kill()
+        pool = type(self)._pool
+        if len(pool) < self.pool_max:
+            pool.append(self)
+
+    def reset(self, game: HasGame | None, pos: Vec2, *groups: pg.sprite.AbstractGroup,
+              size=None, in_root: bool = None, in_display: bool = None,
+              surf: pg.surface.Surface = None, rect: pg.Rect = None):
+        """Re-initialise a released sprite, re-using its surface and rect
+        if the size is the same. Takes the same arguments as `__init__`;
+        subclasses that take extra arguments in `__init__` should override this"""
+        self._set_game_fast(game, 'reset')
+        cls = type(self)
+        # go back to the defaults on the class
+        self.in_root = cls.in_root
+        self.in_display = cls.in_display
+        self._set_group_flags(in_root, in_display)
+        self.add(*self._get_extra_groups(), *groups)
+        # SizedSprite (the size may have been passed to a previous __init__)
+        if size is None:
+            size = cls.size
+            if size is None:
+                raise self._err_missing_size("reset")
+        self.size = size
+        self._pos = pos
+        if self._init_surf_and_rect(surf, rect) and self._has_draw_sprite:
+            self.draw_sprite()
 
     def draw_sprite(self):
         """Called to draw the sprite into its local surface -
@@ -0,0 +1,65 @@
+from unittest import TestCase
+
+import pygame as pg
+from pygame import Vector2 as Vec2
+
+from pg_util import build_grid, nearest_in_grid
+
+
+class TestGrid(TestCase):
+    def setUp(self):
+        self.group = pg.sprite.Group()
+
+    def make_sprite(self, x: float, y: float, alive=True):
+        s = pg.sprite.Sprite()
+        s.pos = Vec2(x, y)
+        if alive:
+            self.group.add(s)
+        return s
+
+    def test_build_grid(self):
+        a = self.make_sprite(1, 2)
+        b = self.make_sprite(9.9, 0)
+        c = self.make_sprite(10, 25)
+        d = self.make_sprite(-0.5, -10)
+        e = self.make_sprite(-10.5, 3)
+        grid = build_grid([a, b, c, d, e], 10)
+        self.assertEqual(dict(grid), {
+            (0, 0): [a, b],
+            (1, 2): [c],
+            # floor division rounds down so negatives don't share cell 0
+            (-1, -1): [d],
+            (-2, 0): [e],
+        })
+
+    def test_nearest(self):
+        far = self.make_sprite(8, 0)
+        near = self.make_sprite(3, 4)
+        grid = build_grid([far, near], 10)
+        self.assertIs(nearest_in_grid(Vec2(0, 0), grid, 10, 10), near)
+
+    def test_empty(self):
+        self.assertIsNone(nearest_in_grid(Vec2(0, 0), build_grid([], 10), 10, 10))
+
+    def test_negative_coordinates(self):
+        s = self.make_sprite(-1, -1)
+        grid = build_grid([s], 10)
+        self.assertIs(nearest_in_grid(Vec2(1, 1), grid, 10, 10), s)
+        self.assertIs(nearest_in_grid(Vec2(-15, -12), grid, 10, 20), s)
+
+    def test_max_dist_across_cell_border(self):
+        # exactly max_dist away and in the next cell is still in range
+        s = self.make_sprite(19, 5)
+        grid = build_grid([s], 10)
+        self.assertIs(nearest_in_grid(Vec2(9, 5), grid, 10, 10), s)
+        self.assertIsNone(nearest_in_grid(Vec2(8.9, 5), grid, 10, 10))
+        self.assertIsNone(nearest_in_grid(Vec2(9, 5), grid, 10, 9.9))
+
+    def test_skips_dead(self):
+        alive = self.make_sprite(5, 0)
+        dead = self.make_sprite(1, 0)
+        grid = build_grid([alive, dead], 10)
+        dead.kill()
+        self.assertIs(nearest_in_grid(Vec2(0, 0), grid, 10, 10), alive)
+        alive.kill()
+        self.assertIsNone(nearest_in_grid(Vec2(0, 0), grid, 10, 10))
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import contextlib
+import functools
+from types import SimpleNamespace
 from typing import TypeVar, Any, Callable
 from unittest import TestCase
-from unittest.mock import patch, PropertyMock, NonCallableMock
+from unittest.mock import patch, MagicMock
 
 import pygame as pg
 from pygame import Vector2 as Vec2
 
+import sprite_bases
 from sprite_bases import (GroupMemberSprite, DrawableSprite, SizedSprite,
                           PositionedSprite, SurfaceMakingSprite,
-                          RectUpdatingSprite)
+                          RectUpdatingSprite, CommonSprite)
 from uses_game import UsesGame
 
 T = TypeVar('T')
@@ -21,6 +24,8 @@ def new(t: type[T]) -> T:
 
 
 class _NamedObject(object):
+    __slots__ = ('name',)
+
     def __init__(self, name: str):
         self.name = name
 
@@ -35,16 +40,54 @@ def obj(name: str = None) -> Any:
         return _NamedObject(name)
 
 
+class _RectStub:
+    """Records writes to ``.center``, much cheaper to make than a Mock"""
+    __slots__ = ('center_calls',)
+
+    def __init__(self):
+        self.center_calls = []
+
+    @property
+    def center(self):
+        raise AssertionError("center should only be set, not read")
+
+    @center.setter
+    def center(self, value):
+        self.center_calls.append(value)
+
+
 class BaseTest(TestCase):
-    _pre_init_list: tuple[tuple[BaseTest, Callable[[BaseTest, Any], Any]]] = ()
-    """``((type, pre_init_fn), ...)``"""
+    _pre_init_list: tuple[tuple[type[BaseTest], type | None,
+                                Callable[[BaseTest, Any], Any]], ...] = ()
+    """``((type, target_cls, pre_init_fn), ...)``"""
     target_cls = None
+    _root_g: pg.sprite.Group
+    _display_g: pg.sprite.Group
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # used by patch_groups, made once per class instead of once per test
+        cls._root_g = pg.sprite.Group()
+        cls._display_g = pg.sprite.Group()
+
+    def tearDown(self):
+        self._root_g.empty()
+        self._display_g.empty()
+        NoGroupPropsMixin.empty_dummy_groups()
+        super().tearDown()
+
+    def assertItemsAre(self, actual, *expected):
+        """Like assertEqual on sequences but compares the items by identity"""
+        self.assertEqual(len(actual), len(expected))
+        for a, e in zip(actual, expected):
+            self.assertIs(a, e)
 
     def on_pre_init(self, inst):
         ...
 
     def pre_init(self, inst, caller_cls):
-        for cls, fn in self._pre_init_list:
+        for own_cls, own_target, fn in self._pre_init_list:
             # only call the pre_init if this test doesn't belong to it.
             # If this pre_init belongs to this test,
             # we're testing the class with this pre_init so we may want to
@@ -53,7 +96,7 @@ class BaseTest(TestCase):
             # e.g. SizedSprite sets .size in pre_init but the tests
             # also require it to be set to their own value
             # so we need to skip running this pre_init
-            if cls != caller_cls and cls.target_cls != caller_cls:
+            if own_cls is not caller_cls and own_target is not caller_cls:
                 fn(self, inst)
 
     def __init_subclass__(cls, **kwargs):
@@ -61,7 +104,11 @@ class BaseTest(TestCase):
                 and cls.on_pre_init != BaseTest.on_pre_init
                 and not getattr(cls.on_pre_init, 'is_nop', False)
                 and cls.on_pre_init != getattr(super(cls, cls), 'on_pre_init', None)):
-            cls._pre_init_list += ((cls, cls.on_pre_init),)
+            entry = (cls, cls.target_cls, cls.on_pre_init)
+            if entry not in cls._pre_init_list:
+                # tuple (not list.append) so that subclasses get their own
+                # copy instead of adding to their parent's list
+                cls._pre_init_list += (entry,)
 
     def new_inst(self, klass=None):
         if klass is None:
@@ -83,8 +130,18 @@ def mark_as_nop(fn):
 
 class TestGroupMemberSprite(BaseTest):
     target_cls = GroupMemberSprite
+    _rg_sentinel: Any
+    _dg_sentinel: Any
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # only compared by identity so can be shared by all the tests
+        cls._rg_sentinel = obj("root_group")
+        cls._dg_sentinel = obj("display_group")
 
     @classmethod
+    @functools.lru_cache(maxsize=None)  # one per test class is enough
     def no_props_cls(cls):
         class NoPropsSprite(cls.target_cls):
             display_group = None
@@ -92,31 +149,32 @@ class TestGroupMemberSprite(BaseTest):
 
         return NoPropsSprite
 
+    def _new_inst_with_flags(self, root, display):
+        s = self.new_inst(self.no_props_cls())
+        s.root_group = self._rg_sentinel
+        s.display_group = self._dg_sentinel
+        s.in_root = root
+        s.in_display = display
+        return s
+
     def test__set_group_flags(self):
-        def setup_inst(root, display):
-            s2 = self.new_inst(self.no_props_cls())
-            s2.root_group = obj("root_group")
-            s2.display_group = obj("display_group")
-            s2.in_root = root
-            s2.in_display = display
-            return s2
-
-        s = setup_inst(False, False)
+        s = self._new_inst_with_flags(False, False)
         self.assertEqual(s._get_extra_groups(), ())
-        s = setup_inst(False, True)
-        self.assertEqual(s._get_extra_groups(), (s.display_group,))
-        s = setup_inst(True, False)
-        self.assertEqual(s._get_extra_groups(), (s.root_group,))
-        s = setup_inst(True, True)
+        s = self._new_inst_with_flags(False, True)
+        self.assertItemsAre(s._get_extra_groups(), s.display_group)
+        s = self._new_inst_with_flags(True, False)
+        self.assertItemsAre(s._get_extra_groups(), s.root_group)
+        s = self._new_inst_with_flags(True, True)
         # order doesn't matter
         self.assertEqual(set(s._get_extra_groups()),
                          {s.display_group, s.root_group})
 
     def test__get_extra_groups(self):
+        # both flags are set explicitly so one instance can be reused
+        s = self.new_inst()
         for in_root in True, False:
             for in_display in True, False:
                 with self.subTest(in_root=in_root, in_display=in_display):
-                    s = self.new_inst()
                     s._set_group_flags(in_root, in_display)
                     self.assertEqual(s.in_root, in_root)
                     self.assertEqual(s.in_display, in_display)
@@ -172,6 +230,7 @@ class TestDrawableSprite(TestGroupMemberSprite):
     target_cls = DrawableSprite
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def no_props_mixed(cls):
         class NoPropsMixedSprite(NoGroupPropsMixin, cls.target_cls):
             ...
@@ -187,8 +246,9 @@ class TestDrawableSprite(TestGroupMemberSprite):
 
     def test_init_DrawableSprite(self):
         surf = obj("surf")
-        rect = obj("rect")
-        with MultiContextManager(patch_groups(self.target_cls)):
+        # a real Rect as subclasses' pre_init may set .center on it
+        rect = pg.Rect(0, 0, 1, 1)
+        with patch_groups(self.target_cls, self._root_g, self._display_g):
             inst = self.new_inst()
             self.pre_init(inst, DrawableSprite)
             inst.__init__(obj(), surf=surf, rect=rect)
@@ -220,22 +280,21 @@ class TestSizedSprite(TestDrawableSprite):
         class Sub(self.target_cls):
             size = sz
 
-        # dark magic with patch(...):
-        # it LITERALLY replaces the rect_from_size
-        # global in the sprite_bases module with a mock version!
-        with patch('sprite_bases.rect_from_size') as m:
-            m.return_value = obj("returned rect")
+        # this replaces the rect_from_size global
+        # in the sprite_bases module with a mock version
+        m = MagicMock(return_value=obj("returned rect"))
+        with swap_attrs(sprite_bases, rect_from_size=m):
             self.assertIs(Sub.get_virtual_rect(pos), m.return_value)
             m.assert_called_once_with(sz, center=pos)
 
-        with patch('sprite_bases.rect_from_size') as m:
-            m.return_value = obj("returned rect")
+        m = MagicMock(return_value=obj("returned rect"))
+        with swap_attrs(sprite_bases, rect_from_size=m):
             self.assertIs(self.target_cls.get_virtual_rect(pos, sz),
                           m.return_value)
             m.assert_called_once_with(sz, center=pos)
 
-        with patch('sprite_bases.rect_from_size') as m:
-            m.return_value = obj("returned rect")
+        m = MagicMock(return_value=obj("returned rect"))
+        with swap_attrs(sprite_bases, rect_from_size=m):
             self.assertIs(Sub.get_virtual_rect(pos, Vec2(sz2)),
                           m.return_value)
             m.assert_called_once_with(sz2, center=pos)
@@ -243,21 +302,29 @@ class TestSizedSprite(TestDrawableSprite):
         with self.assertRaises(TypeError):
             self.target_cls.get_virtual_rect(pos)
 
+        # changing size on the class should still be respected
+        m = MagicMock(return_value=obj("returned rect"))
+        with swap_attrs(Sub, size=Vec2(sz2)), \
+                swap_attrs(sprite_bases, rect_from_size=m):
+            self.assertIs(Sub.get_virtual_rect(pos), m.return_value)
+            m.assert_called_once_with(sz2, center=pos)
+
     def test_init_SizedSprite(self):
         size = obj("size")
-        with MultiContextManager(patch_groups(self.target_cls)):
+        klass = self.no_props_mixed()
+        with patch_groups(self.target_cls, self._root_g, self._display_g):
             inst = self.new_inst()
             self.pre_init(inst, SizedSprite)
             inst.__init__(obj(), size=size)
             self.assertIs(inst.size, size)
 
-        inst = self.no_props_mixed().new_with_dummy_groups()
+        inst = klass.new_with_dummy_groups()
         inst.size = size
         self.pre_init(inst, SizedSprite)
         inst.__init__(obj())
         self.assertIs(inst.size, size)
 
-        inst = self.no_props_mixed().new_with_dummy_groups()
+        inst = klass.new_with_dummy_groups()
         inst.size = obj("size_on_class")
         self.pre_init(inst, SizedSprite)
         inst.__init__(obj(), size=size)
@@ -265,7 +332,7 @@ class TestSizedSprite(TestDrawableSprite):
 
         # if later the error behavior changes, this is the part to change
         with self.assertRaises(TypeError) as r:
-            inst = self.no_props_mixed().new_with_dummy_groups()
+            inst = klass.new_with_dummy_groups()
             self.pre_init(inst, SizedSprite)
             inst.__init__(obj())
         self.assertIn('size', str(r.exception))
@@ -276,29 +343,25 @@ class TestPositionedSprite(TestSizedSprite):
 
     def test_init_PositionedSprite(self):
         pos = obj("pos")
-        with MultiContextManager(patch_groups(self.target_cls)):
+        # the groups are the same for every case so only swap them once
+        with patch_groups(self.target_cls, self._root_g, self._display_g):
             inst = self.new_inst()
             self.pre_init(inst, PositionedSprite)
             inst.__init__(obj(), pos=pos)
             self.assertIs(inst.pos, pos)
 
-        with MultiContextManager(
-                patch_groups(self.target_cls),
-                patch.object(self.target_cls, 'pos', pos)):
-            inst = self.new_inst()
-            self.pre_init(inst, PositionedSprite)
-            inst.__init__(obj())
-            self.assertIs(inst.pos, pos)
+            with swap_attrs(self.target_cls, pos=pos):
+                inst = self.new_inst()
+                self.pre_init(inst, PositionedSprite)
+                inst.__init__(obj())
+                self.assertIs(inst.pos, pos)
 
-        with MultiContextManager(
-                patch_groups(self.target_cls),
-                patch.object(self.target_cls, 'pos', obj("pos on class"))):
-            inst = self.new_inst()
-            self.pre_init(inst, PositionedSprite)
-            inst.__init__(obj(), pos=pos)
-            self.assertIs(inst.pos, pos)
+            with swap_attrs(self.target_cls, pos=obj("pos on class")):
+                inst = self.new_inst()
+                self.pre_init(inst, PositionedSprite)
+                inst.__init__(obj(), pos=pos)
+                self.assertIs(inst.pos, pos)
 
-        with MultiContextManager(patch_groups(self.target_cls)):
             inst = self.new_inst()
             self.pre_init(inst, PositionedSprite)
             with self.assertRaises(TypeError) as r:
@@ -313,8 +376,9 @@ class TestSurfaceMakingSprite(TestPositionedSprite):
     target_cls = SurfaceMakingSprite
 
     def test_init_SurfaceMakingSprite(self):
-        with patch_groups(self.target_cls), \
-                patch.object(self.target_cls, 'make_surface') as m:
+        m = MagicMock()
+        with patch_groups(self.target_cls, self._root_g, self._display_g), \
+                swap_attrs(self.target_cls, make_surface=m):
             inst: SurfaceMakingSprite = self.new_inst()
             self.pre_init(inst, SurfaceMakingSprite)
             m.return_value = obj('make_surface return')
@@ -337,10 +401,11 @@ class TestRectUpdatingSprite(TestSurfaceMakingSprite):
         def new_set_pos(self_inner, value):
             self_inner._pos = value
 
-        with patch.object(self.target_cls, 'update_rect') as m_update_rect, \
-                patch.object(self.target_cls, 'create_rect') as m_create_rect, \
-                patch.object(self.target_cls, 'set_pos', new_set_pos), \
-                patch_groups(self.target_cls):
+        m_update_rect = MagicMock()
+        m_create_rect = MagicMock()
+        with swap_attrs(self.target_cls, update_rect=m_update_rect,
+                        create_rect=m_create_rect, set_pos=new_set_pos), \
+                patch_groups(self.target_cls, self._root_g, self._display_g):
             inst: RectUpdatingSprite = self.new_inst()
             self.pre_init(inst, RectUpdatingSprite)
             rect = inst.rect = obj("rect")
@@ -349,9 +414,11 @@ class TestRectUpdatingSprite(TestSurfaceMakingSprite):
             m_update_rect.assert_not_called()
             m_create_rect.assert_not_called()
         # if rect not provided
-        with patch.object(self.target_cls, 'update_rect') as m_update_rect, \
-                patch.object(self.target_cls, 'create_rect') as m_create_rect, \
-                patch_groups(self.target_cls):
+        m_update_rect = MagicMock()
+        m_create_rect = MagicMock()
+        with swap_attrs(self.target_cls, update_rect=m_update_rect,
+                        create_rect=m_create_rect), \
+                patch_groups(self.target_cls, self._root_g, self._display_g):
             rect = m_create_rect.return_value = obj("rect")
 
             def remember_pos_value(*_, **__):
@@ -377,10 +444,9 @@ class TestRectUpdatingSprite(TestSurfaceMakingSprite):
     def test_update_rect(self):
         inst: RectUpdatingSprite = self.new_inst()
         inst.pos = obj("pos")
-        rect_mock = inst.rect = NonCallableMock()
-        mock_center = type(rect_mock).center = PropertyMock()
+        rect_stub = inst.rect = _RectStub()
         inst.update_rect()
-        mock_center.assert_called_once_with(inst.pos)
+        self.assertEqual(rect_stub.center_calls, [inst.pos])
 
     def test_pos_getter(self):
         inst: RectUpdatingSprite = self.new_inst()
@@ -388,20 +454,23 @@ class TestRectUpdatingSprite(TestSurfaceMakingSprite):
         self.assertIs(inst.pos, pos)
 
     def test_pos_setter(self):
-        with patch.object(self.target_cls, 'set_pos') as m:
+        m = MagicMock()
+        with swap_attrs(self.target_cls, set_pos=m):
             inst: RectUpdatingSprite = self.new_inst()
             pos = inst.pos = obj("pos")
             m.assert_called_once_with(pos)
 
     def test_set_pos(self):
         pos = obj("pos")
-        with patch.object(self.target_cls, 'update_rect') as m:
+        m = MagicMock()
+        with swap_attrs(self.target_cls, update_rect=m):
             inst: RectUpdatingSprite = self.new_inst()
             inst.rect = None
             inst.set_pos(pos)
             self.assertIs(inst._pos, pos)
             m.assert_not_called()
-        with patch.object(self.target_cls, 'update_rect') as m:
+        m = MagicMock()
+        with swap_attrs(self.target_cls, update_rect=m):
             def remember_pos_value(*_, **__):
                 nonlocal pos_in_update_fn
                 pos_in_update_fn = inst._pos
@@ -417,9 +486,210 @@ class TestRectUpdatingSprite(TestSurfaceMakingSprite):
             self.assertIs(pos_in_update_fn, pos)
 
 
+class TestCommonSprite(TestCase):
+    @staticmethod
+    def make_game():
+        return SimpleNamespace(root_group=pg.sprite.Group(),
+                               display_group=pg.sprite.Group())
+
+    def make_cls(self, shared_surface=False):
+        class Sub(CommonSprite):
+            size = Vec2(4, 6)
+            draw_calls = 0
+
+            def draw_sprite(self):
+                self.draw_calls += 1
+
+        Sub.shared_surface = shared_surface
+        return Sub
+
+    def test_init(self):
+        Sub = self.make_cls()
+        game = self.make_game()
+        g1 = pg.sprite.Group()
+        inst = Sub(game, Vec2(10, 20), g1, in_display=False)
+        self.assertIs(inst.game, game)
+        self.assertEqual(set(inst.groups()), {g1, game.root_group})
+        self.assertEqual(inst.size, Vec2(4, 6))
+        self.assertEqual(inst.pos, Vec2(10, 20))
+        self.assertIs(inst.image, inst.surf)
+        self.assertEqual(inst.surf.get_size(), (4, 6))
+        self.assertEqual(inst.rect, pg.Rect(8, 17, 4, 6))
+        self.assertEqual(inst.draw_calls, 1)
+
+        surf = pg.Surface((3, 3))
+        rect = pg.Rect(0, 0, 8, 8)
+        inst = Sub(game, Vec2(10, 20), size=Vec2(8, 8), surf=surf, rect=rect)
+        self.assertEqual(set(inst.groups()),
+                         {game.root_group, game.display_group})
+        self.assertEqual(inst.size, Vec2(8, 8))
+        self.assertIs(inst.surf, surf)
+        self.assertIs(inst.rect, rect)
+        self.assertEqual(inst.rect.center, (10, 20))
+
+        with self.assertRaises(TypeError):
+            CommonSprite(game, Vec2(0, 0))
+        with self.assertRaises(TypeError) as r:
+            Sub(game, None)
+        # the inlined __init__ should give the same error as the base classes
+        with self.assertRaises(TypeError) as r_base:
+            PositionedSprite(game, size=Vec2(4, 6))
+        self.assertEqual(str(r.exception), str(r_base.exception))
+
+    def test_has_draw_sprite(self):
+        class NoDraw(CommonSprite):
+            size = Vec2(3, 3)
+
+        self.assertFalse(NoDraw._has_draw_sprite)
+        self.assertTrue(self.make_cls()._has_draw_sprite)
+        with patch.object(NoDraw, 'draw_sprite') as m:
+            NoDraw(self.make_game(), Vec2(0, 0))
+            m.assert_not_called()
+
+    def test_shared_surface(self):
+        Sub = self.make_cls(shared_surface=True)
+        game = self.make_game()
+        a = Sub(game, Vec2(0, 0))
+        b = Sub(game, Vec2(5, 5))
+        c = Sub(game, Vec2(5, 5), size=Vec2(8, 8))
+        self.assertIs(a.surf, b.surf)
+        self.assertIs(b.image, b.surf)
+        self.assertIsNot(a.surf, c.surf)
+        self.assertEqual(c.surf.get_size(), (8, 8))
+        # any size sequence works, like for make_surface
+        d = Sub(game, Vec2(5, 5), size=(8, 8))
+        self.assertIs(d.surf, c.surf)
+        # only drawn when the surface is made
+        self.assertEqual((a.draw_calls, b.draw_calls, c.draw_calls), (1, 0, 1))
+        self.assertIsNot(a.surf, self.make_cls(shared_surface=True)(game, Vec2()).surf)
+        # the pool doesn't re-draw shared surfaces
+        surf = a.surf
+        a.release()
+        a2 = Sub.acquire(game, Vec2(1, 1))
+        self.assertIs(a2, a)
+        self.assertIs(a2.surf, surf)
+        self.assertEqual(a2.draw_calls, 1)
+
+    def test_not_shared_surface(self):
+        Sub = self.make_cls(shared_surface=False)
+        game = self.make_game()
+        a = Sub(game, Vec2(0, 0))
+        b = Sub(game, Vec2(5, 5))
+        self.assertIsNot(a.surf, b.surf)
+        self.assertEqual((a.draw_calls, b.draw_calls), (1, 1))
+
+    def test_pool_per_class(self):
+        Sub = self.make_cls()
+        self.assertIsNot(Sub._pool, CommonSprite._pool)
+        self.assertIsNot(Sub._pool, self.make_cls()._pool)
+
+    def test_release_acquire(self):
+        Sub = self.make_cls()
+        game = self.make_game()
+        g1 = pg.sprite.Group()
+        inst = Sub.acquire(game, Vec2(10, 20), g1)
+        surf = inst.surf
+        inst.release()
+        self.assertFalse(inst.alive())
+        self.assertEqual(Sub._pool, [inst])
+        inst.release()  # releasing twice mustn't add it twice
+        self.assertEqual(Sub._pool, [inst])
+
+        game2 = self.make_game()
+        inst2 = Sub.acquire(game2, Vec2(30, 40), in_display=False)
+        self.assertIs(inst2, inst)
+        self.assertEqual(Sub._pool, [])
+        self.assertIs(inst2.game, game2)
+        self.assertIs(inst2.surf, surf)
+        self.assertEqual(inst2.pos, Vec2(30, 40))
+        self.assertEqual(inst2.rect.center, (30, 40))
+        self.assertEqual(set(inst2.groups()), {game2.root_group})
+        self.assertEqual(inst2.draw_calls, 2)
+
+        inst2.release()
+        inst3 = Sub.acquire(game2, Vec2(1, 1))
+        self.assertIs(inst3, inst)
+        # flags go back to the class defaults
+        self.assertTrue(inst3.in_display)
+
+    def test_acquire_same_args_as_init(self):
+        for shared in False, True:
+            with self.subTest(shared_surface=shared):
+                Sub = self.make_cls(shared_surface=shared)
+                game = self.make_game()
+                inst = Sub.acquire(game, Vec2(10, 20), size=Vec2(8, 8))
+                self.assertEqual(inst.surf.get_size(), (8, 8))
+                inst.release()
+                # same size again so the surface can be re-used
+                inst2 = Sub.acquire(game, Vec2(10, 20), size=Vec2(8, 8))
+                self.assertIs(inst2, inst)
+                self.assertEqual(inst2.surf.get_size(), (8, 8))
+                self.assertEqual(inst2.rect, pg.Rect(6, 16, 8, 8))
+                inst2.release()
+                # back to the size on the class
+                inst3 = Sub.acquire(game, Vec2(10, 20))
+                self.assertIs(inst3, inst)
+                self.assertEqual(inst3.size, Vec2(4, 6))
+                self.assertEqual(inst3.surf.get_size(), (4, 6))
+                self.assertEqual(inst3.rect, pg.Rect(8, 17, 4, 6))
+                inst3.release()
+
+                surf = pg.Surface((3, 3))
+                rect = pg.Rect(0, 0, 8, 8)
+                inst4 = Sub.acquire(game, Vec2(10, 20), size=Vec2(8, 8),
+                                    surf=surf, rect=rect)
+                self.assertIs(inst4, inst)
+                self.assertIs(inst4.surf, surf)
+                self.assertIs(inst4.image, surf)
+                self.assertIs(inst4.rect, rect)
+                self.assertEqual(inst4.rect.center, (10, 20))
+
+    def test_acquire_drops_passed_surf(self):
+        for shared in False, True:
+            with self.subTest(shared_surface=shared):
+                Sub = self.make_cls(shared_surface=shared)
+                game = self.make_game()
+                mine = pg.Surface((4, 6))
+                my_rect = pg.Rect(0, 0, 4, 6)
+                inst = Sub.acquire(game, Vec2(10, 20), surf=mine, rect=my_rect)
+                inst.release()
+                inst2 = Sub.acquire(game, Vec2(10, 20))
+                self.assertIs(inst2, inst)
+                # same as a new sprite made with the same arguments
+                fresh = Sub(game, Vec2(10, 20))
+                self.assertIsNot(inst2.surf, mine)
+                self.assertIs(inst2.image, inst2.surf)
+                self.assertIsNot(inst2.rect, my_rect)
+                self.assertEqual(inst2.rect, fresh.rect)
+                self.assertEqual(inst2.surf.get_size(), (4, 6))
+                self.assertEqual(inst2.surf is fresh.surf, shared)
+
+    def test_reset_needs_size(self):
+        class NoSize(CommonSprite):
+            pass
+
+        inst = NoSize(self.make_game(), Vec2(0, 0), size=Vec2(2, 2))
+        inst.release()
+        with self.assertRaises(TypeError):
+            NoSize.acquire(self.make_game(), Vec2(0, 0))
+
+    def test_pool_max(self):
+        Sub = self.make_cls()
+        Sub.pool_max = 1
+        game = self.make_game()
+        a = Sub.acquire(game, Vec2(0, 0))
+        b = Sub.acquire(game, Vec2(0, 0))
+        a.release()
+        b.release()
+        self.assertEqual(Sub._pool, [a])
+
+
 class NoGroupPropsMixin:
     display_group = None
     root_group = None
+    # shared by every new_with_dummy_groups() instance, made on first use
+    _dummy_root: pg.sprite.Group | None = None
+    _dummy_display: pg.sprite.Group | None = None
 
     def __init__(self, *args, **kwargs):
         # next class in mro NOT superclass
@@ -430,45 +700,47 @@ class NoGroupPropsMixin:
         assert (UsesGame not in cls.mro()
                 or cls.mro().index(cls) < cls.mro().index(UsesGame)
                 ), "NoGroupPropsMixin must come before UsesGame in mro"
+        if NoGroupPropsMixin._dummy_root is None:
+            NoGroupPropsMixin._dummy_root = pg.sprite.Group()
+            NoGroupPropsMixin._dummy_display = pg.sprite.Group()
         inst = cls.__new__(cls)
-        inst.root_group = pg.sprite.Group()
-        inst.display_group = pg.sprite.Group()
+        inst.root_group = NoGroupPropsMixin._dummy_root
+        inst.display_group = NoGroupPropsMixin._dummy_display
         return inst
 
+    @classmethod
+    def empty_dummy_groups(cls):
+        if NoGroupPropsMixin._dummy_root is not None:
+            NoGroupPropsMixin._dummy_root.empty()
+            NoGroupPropsMixin._dummy_display.empty()
+
 
 class NoPropsDrawableSprite(NoGroupPropsMixin, DrawableSprite):
     ...
 
 
-class MultiContextManager(contextlib.AbstractContextManager):
-    def __init__(self, *contexts: contextlib.AbstractContextManager):
-        self.contexts = contexts
-
-    def __enter__(self):
-        return tuple(c.__enter__() for c in self.contexts)
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        # exit out of the contexts backwards:
-        # enter 0 -> (enter 1 -> (...) -> exit 1) -> exit 0
-        ignore_error = False
-        for c in reversed(self.contexts):
-            if c.__exit__(exc_type, exc_val, exc_tb):
-                ignore_error = True
-                # don't propagate error to outer context
-                # (this context caught the error)
-                exc_type = exc_val = exc_tb = None
-        return ignore_error
+_MISSING = object()
 
 
-def multipatch(t: type | object, *patches: tuple[str, Any], **kw_patches):
-    return MultiContextManager(
-        *(patch.object(t, k, v) for k, v in patches),
-        *(patch.object(t, k, v) for k, v in kw_patches.items())
-    )
+@contextlib.contextmanager
+def swap_attrs(t: type | object, **attrs):
+    """A lighter version of ``patch.object`` for (multiple) attributes that
+    only swaps the values (so use a ``MagicMock`` if the calls need checking)"""
+    # use __dict__ so that we restore it as it was (e.g. deleting the
+    # attribute if it was inherited and not re-setting it on the subclass)
+    orig = {k: vars(t).get(k, _MISSING) for k in attrs}
+    for k, v in attrs.items():
+        setattr(t, k, v)
+    try:
+        yield
+    finally:
+        for k, v in orig.items():
+            if v is _MISSING:
+                delattr(t, k)
+            else:
+                setattr(t, k, v)
 
 
-def patch_groups(t: type):
-    return MultiContextManager(
-        patch.object(t, 'root_group', pg.sprite.Group()),
-        patch.object(t, 'display_group', pg.sprite.Group())
-    )
+def patch_groups(t: type, root: pg.sprite.AbstractGroup,
+                 display: pg.sprite.AbstractGroup):
+    return swap_attrs(t, root_group=root, display_group=display)
@@ -10,15 +10,23 @@ def obj() -> Any:
 
 
 class TestUsesGame(TestCase):
+    _sentinel_game: Any
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # never mutated so can be shared between the tests
+        cls._sentinel_game = obj()
+
     def test__set_game__game(self):
         inst = UsesGame.__new__(UsesGame)
-        g = obj()
+        g = self._sentinel_game
         inst.set_game(g)
         self.assertIs(inst.game, g)
 
     def test__set_game__uses_game(self):
         inst = UsesGame.__new__(UsesGame)
-        g = obj()
+        g = self._sentinel_game
         ug = UsesGame.__new__(UsesGame)
         ug.game = g
         inst.set_game(g)
@@ -65,17 +73,47 @@ class TestUsesGame(TestCase):
         self.assertIs(inst.game, g2)
 
     def test__init__game(self):
-        g = obj()
+        g = self._sentinel_game
         inst = UsesGame(g)
         self.assertIs(inst.game, g)
 
     def test__init__uses_game(self):
-        g = obj()
+        g = self._sentinel_game
         ug = UsesGame.__new__(UsesGame)
         ug.game = g
         inst = UsesGame(ug)
         self.assertIs(inst.game, g)
 
+    def test__set_game_fast__game(self):
+        inst = UsesGame.__new__(UsesGame)
+        g = obj()
+        inst._set_game_fast(g)
+        self.assertIs(inst.game, g)
+
+    def test__set_game_fast__uses_game(self):
+        inst = UsesGame.__new__(UsesGame)
+        g = obj()
+        ug = UsesGame.__new__(UsesGame)
+        ug.game = g
+        inst._set_game_fast(ug)
+        self.assertIs(inst.game, g)
+
+    def test__set_game_fast__keeps_existing(self):
+        inst = UsesGame.__new__(UsesGame)
+        g = inst.game = obj()
+        inst._set_game_fast(None)
+        self.assertIs(inst.game, g)
+
+    def test__set_game_fast__error(self):
+        inst = UsesGame.__new__(UsesGame)
+        with self.assertRaises(RuntimeError) as r:
+            inst._set_game_fast(None)
+        self.assertIn('__init__', str(r.exception))
+        ug = UsesGame.__new__(UsesGame)
+        ug.game = None
+        with self.assertRaises(RuntimeError):
+            inst._set_game_fast(ug)
+
     def test__init__calls_set_game(self):
         with patch.object(UsesGame, 'set_game') as mock_set_game:
             g = obj()
@@ -0,0 +1,46 @@
+from unittest import TestCase
+
+from util import fmt_size, clamp
+
+
+class TestFmtSize(TestCase):
+    def test_bytes(self):
+        self.assertEqual(fmt_size(0), '0 B')
+        self.assertEqual(fmt_size(9999), '9999 B')
+        self.assertEqual(fmt_size(9999.7), '9999 B')
+
+    def test_thresholds(self):
+        self.assertEqual(fmt_size(10_000), '9.8 KiB')
+        self.assertEqual(fmt_size(9_999_999), '9765.6 KiB')
+        self.assertEqual(fmt_size(10_000_000), '9.5 MiB')
+        self.assertEqual(fmt_size(5 * 10**9), '4768.4 MiB')
+        self.assertEqual(fmt_size(10**10), '9.3 GiB')
+
+    def test_past_largest_unit(self):
+        # anything bigger still uses the largest unit
+        self.assertEqual(fmt_size(1024**10), '1024.0 RiB')
+        self.assertEqual(fmt_size(10_000 * 1000**10 - 1), '7888.6 QiB')
+        self.assertEqual(fmt_size(10_000 * 1000**10), '7888.6 QiB')
+        self.assertEqual(fmt_size(10**40), '7888609052.2 QiB')
+
+
+class TestClamp(TestCase):
+    def test_both_bounds(self):
+        self.assertEqual(clamp(5, 0, 10), 5)
+        self.assertEqual(clamp(-3, 0, 10), 0)
+        self.assertEqual(clamp(12, 0, 10), 10)
+        self.assertEqual(clamp(0, 0, 10), 0)
+        self.assertEqual(clamp(10, 0, 10), 10)
+
+    def test_one_bound(self):
+        self.assertEqual(clamp(1, 2, None), 2)
+        self.assertEqual(clamp(3, 2, None), 3)
+        self.assertEqual(clamp(0.5, None, 0.35), 0.35)
+        self.assertEqual(clamp(0.1, None, 0.35), 0.1)
+        self.assertEqual(clamp(-10**9), -10**9)
+
+    def test_same_as_min_max(self):
+        # if low > high, high wins (like min(max(value, low), high))
+        for value in -1, 2, 5:
+            with self.subTest(value=value):
+                self.assertEqual(clamp(value, 3, 1), min(max(value, 3), 1))
@@ -18,15 +18,18 @@ class TextSprite(RectUpdatingSprite):
     always_render = False
 
     def __init__(self, game: HasGame | None, text: str, pos: Vec2 = None):
-        self.set_game(game, method_name='__init__')
-        self.pos = pos or self.pos
+        self._set_game_fast(game)
+        self.pos = pos if pos is not None else self.pos
         self.set_text(text)
         super().__init__(None)
 
     def set_text(self, text: str):
-        if text != self.text or self.surf is None or self.always_render:
-            self.text = text
-            self.set_surf(self.render_text())
+        if text == self.text and self.surf is not None and not self.always_render:
+            # nothing changed so don't re-render (this is called every tick
+            # by most subclasses). Position changes are handled by update_rect
+            return
+        self.text = text
+        self.set_surf(self.render_text())
         if self.surf is None:
             raise RuntimeError("surface was not been returned from"
                                " render_text or wasn't set by set_surf")
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Literal, TYPE_CHECKING
+from typing import Any, Iterable, Literal, TYPE_CHECKING
 
 import pygame as pg
 from pygame import Vector2 as Vec2
 
 from bullet import Bullet
-from pg_util import nearest_of_group
+from pg_util import nearest_in_grid
 from sprite_bases import CommonSprite
 
 if TYPE_CHECKING:
@@ -17,6 +17,11 @@ SHOW_TURRET_RANGE = True
 INSTANT_SHOOT = False
 TURRET_INTERVAL = 45
 TURRET_RANGE = 140
+# cell size of Game.enemy_grid, must be at least TURRET_RANGE
+ENEMY_GRID_CELL = TURRET_RANGE
+
+_RANGE_COLOR = pg.Color(0, 255, 0, 60)
+_RANGE_CENTER = (TURRET_RANGE, TURRET_RANGE)  # of TurretRangeIndicator.surf
 
 
 class Turret(CommonSprite):
@@ -27,34 +32,35 @@ class Turret(CommonSprite):
         self.set_game(game)
         super().__init__(None, pos, self.game.turrets, *groups)
         self.interval = interval
-        self.shot_on_tick = None
+        self.next_shot_tick = 0  # can shoot straight away
         if SHOW_TURRET_RANGE:
             TurretRangeIndicator(self, self.pos)
-        self.game.tutorial.place_turret()
+        self.game.emit('place_turret', self)
 
     def draw_sprite(self):
         pg.draw.rect(self.surf, 'darkgreen', self.surf.get_rect())
 
     def can_shoot(self):
-        return (self.shot_on_tick is None
-                or self.curr_tick >= self.shot_on_tick + self.interval)
+        return self.game.curr_tick >= self.next_shot_tick
 
     def update(self, *args: Any, **kwargs: Any) -> None:
+        grid = self.game.enemy_grid
+        if not grid:
+            return  # no enemies at all (e.g. early on) so nothing to search
         if self.can_shoot():
-            target: CommonEnemy = nearest_of_group(self.pos, self.game.enemies)
-            if target is not None and self.can_shoot_enemy(target):
+            # this only returns enemies that are in range
+            target: CommonEnemy = nearest_in_grid(
+                self.pos, grid, ENEMY_GRID_CELL, TURRET_RANGE)
+            if target is not None:
                 self.shoot_enemy(target)
 
     def shoot_enemy(self, enemy: CommonEnemy,
                     update_shot_time=True, instant=INSTANT_SHOOT):
-        bullet = Bullet(self, self.pos, enemy.pos)
+        bullet = Bullet.acquire(self, self.pos, enemy.pos)
         if instant:
             bullet.on_hit_enemy(enemy)
         if update_shot_time:
-            self.shot_on_tick = self.curr_tick
-
-    def can_shoot_enemy(self, enemy: CommonEnemy):
-        return self.pos.distance_squared_to(enemy.pos) <= TURRET_RANGE * TURRET_RANGE
+            self.next_shot_tick = self.game.curr_tick + self.interval
 
 
 class TurretRangeIndicator(CommonSprite):
@@ -62,7 +68,7 @@ class TurretRangeIndicator(CommonSprite):
     common_surf: pg.surface.Surface = None
     """The surface that is drawn for each overlay"""
 
-    need_redraw: list[TurretRangeIndicator] | Literal['all'] = 'all'
+    need_redraw: set[TurretRangeIndicator] | Literal['all'] = 'all'
     overlays_surf: pg.Surface = None
 
     def __init__(self, game: HasGame, pos: Vec2, *groups: pg.sprite.AbstractGroup):
@@ -78,11 +84,15 @@ class TurretRangeIndicator(CommonSprite):
 
     def make_common_surf(self):
         self.common_surf = pg.surface.Surface(self.size, pg.SRCALPHA)
-        pg.draw.circle(self.common_surf, pg.color.Color(0, 255, 0, 60),
-                       self.size / 2, TURRET_RANGE)
+        pg.draw.circle(self.common_surf, _RANGE_COLOR, _RANGE_CENTER, TURRET_RANGE)
 
-    def draw_overlay(self, target: pg.surface.Surface):
-        return target.blit(self.surf, self.rect, None, special_flags=pg.BLEND_RGBA_MAX)
+    @classmethod
+    def draw_overlays(cls, target: pg.surface.Surface,
+                      overlays: Iterable[TurretRangeIndicator]):
+        """Draw the overlays onto `target` (in a single `blits` call),
+        combining them using `BLEND_RGBA_MAX` so overlapping ones don't add up"""
+        target.blits([(t.surf, t.rect, None, pg.BLEND_RGBA_MAX)
+                      for t in overlays], False)
 
     def draw_sprite(self):
         pass  # already draw when surface created
@@ -100,7 +110,8 @@ class TurretRangeIndicator(CommonSprite):
         if 'all' in args:
             cls.need_redraw = 'all'
         else:
-            cls.need_redraw += args
+            # a set so requesting the same one twice only draws it once
+            cls.need_redraw.update(args)
 
     @classmethod
     def make_overlay_surf(cls, game: Game, force_remake=False):
@@ -120,13 +131,10 @@ class TurretRangeIndicator(CommonSprite):
         cls.make_overlay_surf(game)
         if cls.need_redraw == 'all':
             cls.overlays_surf.fill((0, 0, 0, 0))
-            for t in game.turret_range_overlays:
-                t: TurretRangeIndicator
-                t.draw_overlay(cls.overlays_surf)
+            cls.draw_overlays(cls.overlays_surf, game.turret_range_overlays)
         else:
-            for t in cls.need_redraw:
-                t.draw_overlay(cls.overlays_surf)
-        cls.need_redraw = []
+            cls.draw_overlays(cls.overlays_surf, cls.need_redraw)
+        cls.need_redraw = set()
 
     @classmethod
     def blit_all(cls, game: Game):
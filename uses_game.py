@@ -19,10 +19,24 @@ class UsesGame:
             game = game.game
         self.game = game or self.game
         if strict and self.game is None:
-            raise RuntimeError(
-                f"game needs to be specified when using strict=True "
-                f"(either as an attribute before calling "
-                f"{method_name} or passed as an argument)")
+            raise self._err_missing_game(method_name)
+
+    def _set_game_fast(self, game: HasGame | None, method_name='__init__'):
+        """Same as ``set_game(game, method_name=method_name)``, for use in
+        the `__init__` of objects that are created very often"""
+        if isinstance(game, UsesGame):
+            game = game.game
+        if game:
+            self.game = game
+        elif self.game is None:
+            raise self._err_missing_game(method_name)
+
+    @classmethod
+    def _err_missing_game(cls, method_name: str) -> RuntimeError:
+        return RuntimeError(
+            f"game needs to be specified when using strict=True "
+            f"(either as an attribute before calling "
+            f"{method_name} or passed as an argument)")
 
     @property
     def curr_tick(self):
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import random
-from math import inf
+from bisect import bisect_right
 from typing import TypeVar
 
 T = TypeVar('T')
@@ -21,21 +21,31 @@ def uniform_from_mean(mean: float, size: float,
 
 def clamp(value: NT, low: NT | None = None,
           high: NT | None = None) -> NT:
-    if low is None:
-        low = -inf
-    if high is None:
-        high = inf
-    return min(max(value, low), high)
+    # same result as min(max(value, low), high) but without the
+    # function calls or comparing against infinities for missing bounds
+    if low is not None and value < low:
+        value = low
+    if high is not None and value > high:
+        value = high
+    return value
+
+
+def _make_size_table():
+    prefs = ('K', 'M', 'G', 'T', 'P', 'E', 'Z', 'Y', 'R', 'Q')
+    # eg. max 9999.9 KiB to use KiB
+    thresholds = tuple(10_000 * 1000**(i+1) for i in range(len(prefs)))
+    units = tuple((1024**(i+1), f'{pref}iB') for i, pref in enumerate(prefs))
+    return thresholds, units
+
+
+_SIZE_THRESHOLDS, _SIZE_UNITS = _make_size_table()
 
 
 def fmt_size(sz_bytes: int | float) -> str:
     sz_bytes = int(sz_bytes)  # can't have 5.3 of a byte
     if sz_bytes < 10*1000:
         return f'{sz_bytes} B'
-    prefs = ('K', 'M', 'G', 'T', 'P', 'E', 'Z', 'Y', 'R', 'Q')
-    for i, pref in enumerate(prefs):
-        max_threshold = 10_000 * 1000**(i+1)  # eg. max 9999.9 KiB to use KiB
-        multiplier = 1024**(i+1)
-        if sz_bytes < max_threshold or i == len(pref) - 1:
-            return f'{sz_bytes/multiplier:.1f} {pref}iB'
-    raise AssertionError("Unreachable code has been reached")
+    # the largest unit is used for anything bigger than its threshold
+    i = min(bisect_right(_SIZE_THRESHOLDS, sz_bytes), len(_SIZE_UNITS) - 1)
+    multiplier, unit = _SIZE_UNITS[i]
+    return f'{sz_bytes/multiplier:.1f} {unit}'